@@ -11,10 +11,16 @@ from engine.base_scene import BaseScene
 CURRENT_FOLDER = os.path.basename(os.path.dirname(os.path.dirname(__file__)))
 IGNORE_FOLDERS = {CURRENT_FOLDER, SHARED_FOLDER}
 
+# Game folder listing, rebuilt only when the data folder changes (keyed on its mtime)
+_games_cache = {"mtime": None, "list": None}
+
 
 class InitialScene(BaseScene):
+    IDLE_WAIT = True  # Static menu, the main loop sleeps until input arrives
+
     def __init__(self, core_manager, debug=False):
         self.font = pygame.font.SysFont(None, 28)
+        self.button_font = pygame.font.SysFont(None, 22)
         self.bg_color = (40, 40, 40)
         self.text_color = (220, 220, 220)
         self.games = self.list_games()
@@ -90,7 +96,7 @@ class InitialScene(BaseScene):
                 text=game,
                 x=40, y=start_y + i * (btn_h + gap),
                 w=btn_w, h=btn_h,
-                font=pygame.font.SysFont(None, 22),
+                font=self.button_font,
                 bg_color=(60, 60, 60),
                 text_color=self.text_color,
                 callback=self._make_launch_callback(game),
@@ -105,7 +111,7 @@ class InitialScene(BaseScene):
             text="Quit",
             x=40, y=quit_y,
             w=btn_w, h=btn_h,
-            font=pygame.font.SysFont(None, 22),
+            font=self.button_font,
             bg_color=(60, 60, 60),
             text_color=self.text_color,
             callback=self.core_manager.quit_game,
@@ -125,10 +131,20 @@ class InitialScene(BaseScene):
     @staticmethod
     def list_games():
         """Return list of available game folders."""
-        return [
-            name for name in os.listdir(DATA_FOLDER)
-            if os.path.isdir(os.path.join(DATA_FOLDER, name)) and name not in IGNORE_FOLDERS
-        ]
+        # Reuse the previous scan while the folder is unchanged
+        mtime = os.stat(DATA_FOLDER).st_mtime_ns
+        if _games_cache["mtime"] == mtime:
+            return list(_games_cache["list"])
+
+        # Directory type comes from the scandir entry, no stat() per folder
+        with os.scandir(DATA_FOLDER) as entries:
+            games = [
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False) and entry.name not in IGNORE_FOLDERS
+            ]
+        _games_cache["mtime"] = mtime
+        _games_cache["list"] = games
+        return list(games)
 
     def _make_launch_callback(self, game_name):
         """Return a callback that launches the given game."""
@@ -136,14 +152,27 @@ class InitialScene(BaseScene):
             self.launch_game(game_name)
         return _cb
 
+    def _prune_launched_games(self):
+        """Forget games whose process has exited (polled on demand, never per frame)."""
+        self.launched_games = {
+            name: proc for name, proc in self.launched_games.items()
+            if proc.poll() is None
+        }
+
     def launch_game(self, game_name):
         """Launch the given game in a new subprocess."""
+        # Only launch folders discovered by list_games (the name ends up on a command line)
+        if game_name not in self.games:
+            print(f"Unknown game '{game_name}'.")
+            return
+
+        self._prune_launched_games()
+
         if not self.debug and self.launched_games:
             print("A game is already running.")
             return
 
-        proc = self.launched_games.get(game_name)
-        if proc and proc.poll() is None:
+        if game_name in self.launched_games:
             print(f"Game '{game_name}' is already running.")
             return
 
@@ -153,7 +182,7 @@ class InitialScene(BaseScene):
         self.launched_games[game_name] = proc
 
         if not self.debug:
-            pygame.display.iconify()
+            self.window_manager.iconify()
 
     """
     Operations
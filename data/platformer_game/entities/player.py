@@ -9,6 +9,9 @@ class Player(Entity):
     GRAVITY = 900  # pixels per second squared
     JUMP_VELOCITY = -450
     MOVE_SPEED = 250
+    MAX_X = 640 - WIDTH  # Rightmost position inside the 640 px play area
+    GROUND_COLOR = (255, 100, 100)
+    AIR_COLOR = (255, 180, 180)
 
     def __init__(self, x, y):
         super().__init__()
@@ -18,6 +21,10 @@ class Player(Entity):
         self.vy = 0
         self.on_ground = False
 
+        # Solid-color sprites, built on first render once the display exists
+        self._sprite_grounded = None
+        self._sprite_air = None
+
     def update(self, dt, move_left, move_right, jump, ground_y):
         self.vx = 0
         if move_left:
@@ -38,8 +45,21 @@ class Player(Entity):
             self.vy = 0
             self.on_ground = True
 
-        self.x = max(0, min(self.x, 640 - self.WIDTH))
+        # Clamp to the play area (comparisons instead of nested min/max calls)
+        if self.x < 0:
+            self.x = 0
+        elif self.x > self.MAX_X:
+            self.x = self.MAX_X
+
+    def _build_sprite(self, color):
+        sprite = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+        sprite.fill(color)
+        return sprite
 
     def render(self, surface):
-        color = (255, 100, 100) if self.on_ground else (255, 180, 180)
-        pygame.draw.rect(surface, color, (int(self.x), int(self.y), self.WIDTH, self.HEIGHT))
+        if self._sprite_grounded is None:
+            self._sprite_grounded = self._build_sprite(self.GROUND_COLOR)
+            self._sprite_air = self._build_sprite(self.AIR_COLOR)
+
+        sprite = self._sprite_grounded if self.on_ground else self._sprite_air
+        surface.blit(sprite, (int(self.x), int(self.y)))
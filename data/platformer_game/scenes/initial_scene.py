@@ -7,19 +7,31 @@ from data.platformer_game.scenes.menu_scene import MenuScene
 
 class InitialScene(BaseScene):
     def __init__(self, core_manager):
-        self.player = Player(100, 300)
+        self.player = None
         self.ground_y = 400
+        self._background = None
+        self._move_left_bit = 0
+        self._move_right_bit = 0
+        self._jump_bit = 0
 
         # Initialize BaseScene and components
         super().__init__(core_manager)
 
     """
     Configuration
+        reset
         enter
         exit
         _setup
         _setup_input
+        _build_background
     """
+    def reset(self):
+        """
+        Start a new visit with a fresh player (returning from the menu resumes the current one).
+        """
+        self.player = Player(100, 300)
+
     def enter(self):
         super().enter()
 
@@ -49,6 +61,22 @@ class InitialScene(BaseScene):
 
         self.input_manager.load_config(input_config)
 
+        # Resolve action bits once, update() only masks the held-action state
+        self._move_left_bit = self.input_manager.action_bit('move_left')
+        self._move_right_bit = self.input_manager.action_bit('move_right')
+        self._jump_bit = self.input_manager.action_bit('jump')
+
+    def _build_background(self, size):
+        """
+        Compose the static background (sky and ground platform).
+        """
+        background = pygame.Surface(size).convert()
+        background.fill((135, 206, 235))  # Sky blue background
+
+        # Draw ground platform
+        pygame.draw.rect(background, (50, 205, 50), (0, self.ground_y, 640, 80))
+        return background
+
 
     """
     Operations
@@ -66,18 +94,19 @@ class InitialScene(BaseScene):
         """
         Update components.
         """
-        move_left = self.input_manager.is_action_active('move_left')
-        move_right = self.input_manager.is_action_active('move_right')
-        jump = self.input_manager.is_action_active('jump')
+        mask = self.input_manager.active_mask
+        move_left = mask & self._move_left_bit
+        move_right = mask & self._move_right_bit
+        jump = mask & self._jump_bit
         self.player.update(dt, move_left, move_right, jump, self.ground_y)
 
     def render(self, surface=None):
         """
         Render components.
         """
-        surface.fill((135, 206, 235))  # Sky blue background
-
-        # Draw ground platform
-        pygame.draw.rect(surface, (50, 205, 50), (0, self.ground_y, 640, 80))
+        # Static sky and ground, composed once and blitted every frame
+        if self._background is None or self._background.get_size() != surface.get_size():
+            self._background = self._build_background(surface.get_size())
+        surface.blit(self._background, (0, 0))
 
         self.player.render(surface)
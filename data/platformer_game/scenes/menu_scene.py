@@ -4,26 +4,32 @@ import pygame
 from engine.base_scene import BaseScene
 
 class MenuScene(BaseScene):
+    IDLE_WAIT = True             # Static screen, only redraws on input (and the rebind blink)
     BASE_FONT_SIZE_RATIO = 0.05  # 5% of screen height for font size
     PADDING_RATIO = 0.03         # 3% of screen width for padding
     ACTIONS = ['move_left', 'move_right', 'jump']
+    TEXT_CACHE_SIZE = 64         # Max cached text surfaces before the cache is reset
 
     def __init__(self, core_manager):
         super().__init__(core_manager)
 
-        self.screen_w, self.screen_h = pygame.display.get_surface().get_size()
-        self.font_size = max(16, int(self.screen_h * self.BASE_FONT_SIZE_RATIO))
-        self.padding = int(self.screen_w * self.PADDING_RATIO)
-        self.line_spacing = self.font_size + 8
+        # Layout, built in enter() from the display size at that time
+        self.screen_w = None
+        self.screen_h = None
+        self.font_size = None
+        self.padding = None
+        self.line_spacing = None
 
-        self.font = pygame.font.SysFont(None, self.font_size)
+        self.font = None
+        self._text_cache = {}
+        self._key_name_cache = {}
 
-        self.selected_index = 0
-        self.waiting_for_key = False
-        self.message = "Use Up/Down to select, Enter to rebind, R to return"
+        self.selected_index = None
+        self.waiting_for_key = None
+        self.message = None
 
-        self.blink_timer = 0
-        self.blink_visible = True
+        self.blink_timer = None
+        self.blink_visible = None
 
         # Initialize BaseScene and components
         super().__init__(core_manager)
@@ -31,9 +37,11 @@ class MenuScene(BaseScene):
     """
     Configuration
         _setup
+        reset
         enter
         exit
         _setup_input
+        _setup_layout
     """
     def _setup(self):
         """
@@ -44,7 +52,19 @@ class MenuScene(BaseScene):
         # Initialize components
         pass
 
+    def reset(self):
+        """
+        Reset per-visit state (the instance is reused by the scene cache).
+        """
+        self.selected_index = 0
+        self.waiting_for_key = False
+        self.message = "Use Up/Down to select, Enter to rebind, R to return"
+
+        self.blink_timer = 0
+        self.blink_visible = True
+
     def enter(self):
+        self._setup_layout()
         super().enter()
 
     def exit(self):
@@ -65,6 +85,25 @@ class MenuScene(BaseScene):
         }
         self.input_manager.load_config(input_config)
 
+    def _setup_layout(self):
+        """
+        Size the font and spacing from the current display size.
+        """
+        screen_size = pygame.display.get_surface().get_size()
+
+        # Early return if action is not applicable
+        if screen_size == (self.screen_w, self.screen_h):
+            return
+
+        self.screen_w, self.screen_h = screen_size
+        self.font_size = max(16, int(self.screen_h * self.BASE_FONT_SIZE_RATIO))
+        self.padding = int(self.screen_w * self.PADDING_RATIO)
+        self.line_spacing = self.font_size + 8
+
+        # Cached text was rasterized with the previous font
+        self.font = pygame.font.SysFont(None, self.font_size)
+        self._text_cache.clear()
+
     """
     WIP
     """
@@ -112,6 +151,19 @@ class MenuScene(BaseScene):
         self.message = f"Rebound '{action}' to {pygame.key.name(new_key)}"
         self.waiting_for_key = False
 
+    def _render_text(self, text, color):
+        """
+        Return the rendered surface for a text, rasterizing it only once.
+        """
+        key = (text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # Bound the cache, old messages and bindings are not reused
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surf = self._text_cache[key] = self.font.render(text, True, color)
+        return surf
+
     """
     Operations
         events
@@ -145,7 +197,7 @@ class MenuScene(BaseScene):
         surface.fill((20, 20, 20))
 
         # Draw the message (always visible, no blinking)
-        msg_surf = self.font.render(self.message, True, (255, 255, 255))
+        msg_surf = self._render_text(self.message, (255, 255, 255))
         surface.blit(msg_surf, (self.padding, self.padding))
 
         # Start y a bit lower to add extra space after message
@@ -154,7 +206,9 @@ class MenuScene(BaseScene):
         for i, action in enumerate(self.ACTIONS):
             mapping = self.input_manager.mappings.get(action, {})
             key_code = mapping.get("key")
-            key_name = pygame.key.name(key_code) if key_code else "Unbound"
+            key_name = self._key_name_cache.get(key_code)
+            if key_name is None:
+                key_name = self._key_name_cache[key_code] = pygame.key.name(key_code) if key_code else "Unbound"
             text = f"{action}: {key_name}"
 
             color = (255, 255, 0) if i == self.selected_index else (180, 180, 180)
@@ -163,6 +217,6 @@ class MenuScene(BaseScene):
                 # Skip rendering to create blink off effect
                 pass
             else:
-                action_surf = self.font.render(text, True, color)
+                action_surf = self._render_text(text, color)
                 surface.blit(action_surf, (self.padding, y))
             y += self.line_spacing
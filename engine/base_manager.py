@@ -37,6 +37,12 @@ class BaseManager(ABC):
             update(dt): Update components.
             render(surface): Render components.
     """
+    # Fixed attribute layout, subclasses may extend it with their own __slots__
+    __slots__ = (
+        "class_name", "app_config", "config",
+        "core_manager", "debug_manager", "input_manager", "scene_manager", "ui_manager", "window_manager",
+    )
+
     def __init__(self, core_manager=None, app_config=None):
         # Load application configuration if not provided
         if app_config is None:
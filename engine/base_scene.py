@@ -6,6 +6,9 @@ class BaseScene(ABC):
     """
     Abstract base class for all scenes.
 
+    Constants:
+        IDLE_WAIT (bool): Whether the main loop may sleep until input arrives (static scenes only).
+
     Attributes:
         Base Attributes:
             class_name (str): Name of the class.
@@ -21,6 +24,7 @@ class BaseScene(ABC):
     Methods:
         Configuration:
             _setup(): Internal initialization (calls _setup_input and setup).
+            reset(): Called when the scene starts a new visit (on set/push, not when resumed by a pop).
             enter(): Called when scene becomes active (on set/push).
             exit(): Called when scene becomes inactive (on pop).
             _setup_input(): Configure input mapping and callbacks.
@@ -30,6 +34,9 @@ class BaseScene(ABC):
             update(dt): Update components.
             render(surface): Render components.
     """
+    # Constants
+    IDLE_WAIT = False
+
     def __init__(self, core_manager):
         # Class Attributes
         self.class_name = self.__class__.__name__
@@ -45,11 +52,20 @@ class BaseScene(ABC):
 
     """
     Configuration
+        reset
         enter
         exit
         _setup
         _setup_input
     """
+    def reset(self):
+        """
+        Called when the scene starts a new visit (on set/push, not when resumed by a pop).
+
+        Scene instances are reused across transitions, per-visit state is rebuilt here.
+        """
+        pass
+
     @abstractmethod
     def enter(self):
         """
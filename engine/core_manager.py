@@ -2,6 +2,7 @@
 
 import random
 import sys
+import time
 import pygame
 from engine.base_manager import BaseManager
 from engine.debug_manager import DebugManager
@@ -14,6 +15,10 @@ class CoreManager(BaseManager):
     """
     Manage application.
 
+    Constants:
+        IDLE_TIMEOUT (int): Maximum wait for events when the current scene is idle (milliseconds).
+        MAX_DT (float): Upper bound for the frame delta passed to updates (seconds).
+
     Attributes:
         Base Attributes:
             class_name (str): Name of the class.
@@ -32,6 +37,7 @@ class CoreManager(BaseManager):
             fps (int): Frames per second target.
             clock (pygame.time.Clock): Clock to track time.
             total_play_time (float): Total time elapsed (seconds).
+            _last_time (float): High-resolution timestamp of the previous frame (seconds).
 
         State Attributes:
             running (bool): Controls whether the main loop is active.
@@ -59,6 +65,10 @@ class CoreManager(BaseManager):
             update(dt): Update components.
             render(surface): Render components.
     """
+    # Constants
+    IDLE_TIMEOUT = 50
+    MAX_DT = 0.05
+
     def __init__(self, initial_scene_class, app_config=None, run=True):
         """
         Initialize the class.
@@ -80,6 +90,7 @@ class CoreManager(BaseManager):
         self.fps = None
         self.clock = None
         self.total_play_time = None
+        self._last_time = None
 
         # State Attributes
         self.running = None
@@ -153,6 +164,7 @@ class CoreManager(BaseManager):
         # Time Attributes
         self.clock = pygame.time.Clock()
         self.total_play_time = 0
+        self._last_time = time.perf_counter()
 
         # Manager Attributes
         self.core_manager = self
@@ -186,12 +198,25 @@ class CoreManager(BaseManager):
         Executes the main loop.
         """
         while self.running:
-            # Update time (seconds)
-            dt = self.clock.tick(self.fps) / 1000
+            # Pace the frame with the clock, but measure dt with the high-resolution timer
+            # (clock.tick reports whole milliseconds, coarser still on some platforms)
+            self.clock.tick(self.fps)
+            now = time.perf_counter()
+            dt = now - self._last_time
+            self._last_time = now
             self.total_play_time += dt
 
-            # Gather frame events
-            events = pygame.event.get()
+            # Clamp stalls (window drag, breakpoints) so physics does not jump
+            if dt > self.MAX_DT:
+                dt = self.MAX_DT
+
+            # Gather frame events (idle scenes sleep until input arrives, bounded by IDLE_TIMEOUT)
+            scene = self.scene_manager.current_scene
+            if scene is not None and scene.IDLE_WAIT:
+                event = pygame.event.wait(self.IDLE_TIMEOUT)
+                events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+            else:
+                events = pygame.event.get()
 
             surface = self.window_manager.render_surface
 
@@ -242,7 +267,11 @@ class CoreManager(BaseManager):
         for event in events:
             # Pygame events
             if event.type == pygame.VIDEORESIZE:
-                self.window_manager.resize()
+                self.window_manager.resize(event.size)
+            if event.type == pygame.WINDOWDISPLAYCHANGED:
+                self.window_manager.invalidate_desktop_size()
+            if event.type == pygame.WINDOWEXPOSED:
+                self.window_manager.invalidate_present()
             if event.type == pygame.QUIT:
                 self.quit_game()
 
@@ -259,12 +288,16 @@ class CoreManager(BaseManager):
         self.scene_manager.update(dt)
         self.debug_manager.update(dt)
         self.ui_manager.update()
-        self.window_manager.update()
+        self.window_manager.update(dt)
 
     def render(self, surface=None):
         """
         Render components.
         """
+        # Early return if nothing would be visible (minimized or hidden window)
+        if not pygame.display.get_active():
+            return
+
         self.scene_manager.render(surface)
         self.debug_manager.render(surface)
         self.ui_manager.render(surface)
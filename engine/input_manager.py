@@ -12,6 +12,7 @@ class InputManager(BaseManager):
         DEVICES (list[str]): Available input devices.
         EVENT_TYPES (list[str]): Input event types.
         DEVICE_TO_EVENT (dict[str, tuple[str, str]]): Maps device to its down/up event types.
+        EVENT_DISPATCH (dict[int, tuple[str, str, str, bool]]): Maps pygame event type to (device, code attribute, event type, pressed state).
 
     Attributes:
         Input Attributes:
@@ -19,6 +20,9 @@ class InputManager(BaseManager):
             mappings (dict): Stores all action mappings by device type and input code.
             persisted_input (dict): Stores all bindings and mappings for persistence across reloads.
             input_state (dict[str, dict[int, bool]]): Current pressed state for all devices.
+            action_bits (dict[str, int]): Bit assigned to each mapped action.
+            active_mask (int): Bitwise OR of the bits of all currently held actions.
+            _code_bits (dict[tuple[str, int], int]): Maps (device, code) to the action bits it drives.
 
     Methods:
         Configuration:
@@ -31,6 +35,7 @@ class InputManager(BaseManager):
 
         Input Utilities:
             is_action_active(action): Check if an action is currently active (held).
+            action_bit(action): Return the bit of an action in active_mask.
             clear_local_callbacks(): Remove all local callbacks.
             clear_all_callbacks(): Remove all callbacks.
 
@@ -48,6 +53,13 @@ class InputManager(BaseManager):
         "key": ("key_down", "key_up"),
         "mouse": ("mouse_down", "mouse_up")
     }
+    # Event types come from DEVICE_TO_EVENT so the two tables cannot drift apart
+    EVENT_DISPATCH = {
+        pygame.KEYDOWN: ("key", "key", DEVICE_TO_EVENT["key"][0], True),
+        pygame.KEYUP: ("key", "key", DEVICE_TO_EVENT["key"][1], False),
+        pygame.MOUSEBUTTONDOWN: ("mouse", "button", DEVICE_TO_EVENT["mouse"][0], True),
+        pygame.MOUSEBUTTONUP: ("mouse", "button", DEVICE_TO_EVENT["mouse"][1], False),
+    }
 
     def __init__(self, core_manager=None, app_config=None):
         # Input Attributes
@@ -55,6 +67,9 @@ class InputManager(BaseManager):
         self.mappings = {}
         self.persisted_input = {"bind": [], "map": {}}
         self.input_state = {device: {} for device in self.DEVICES}
+        self.action_bits = {}
+        self.active_mask = 0
+        self._code_bits = {}
 
         # Initialize BaseManager and components
         super().__init__(core_manager, app_config)
@@ -149,8 +164,21 @@ class InputManager(BaseManager):
         if device_type not in self.DEVICES:
             raise ValueError(f"Invalid device '{device_type}', expected one of {self.DEVICES}.")
 
+        # Release the bit from the previous mapping (a held old key must not keep the action active)
+        bit = self.action_bit(action)
+        for old_device, old_code in self.mappings.get(action, {}).items():
+            old_key = (old_device, old_code)
+            self._code_bits[old_key] = self._code_bits.get(old_key, 0) & ~bit
+
         # Register the action
         self.mappings[action] = {device_type: code}
+        self._code_bits[(device_type, code)] = self._code_bits.get((device_type, code), 0) | bit
+
+        # Rebuild the bit from the held state of the new code (remapping to a held key keeps the action active)
+        if self.input_state[device_type].get(code):
+            self.active_mask |= bit
+        else:
+            self.active_mask &= ~bit
 
         # Persist this mapping
         self.persisted_input["map"][action] = {device_type: code}
@@ -158,6 +186,7 @@ class InputManager(BaseManager):
     """
     Input Utilities
         is_action_active
+        action_bit
         clear_local_callbacks
         clear_all_callbacks
     """
@@ -176,14 +205,30 @@ class InputManager(BaseManager):
         if not mapping:
             return False
 
-        # Check all mapped inputs
+        # Check all mapped inputs (input_state holds every device, no fallback dict needed)
+        input_state = self.input_state
         for device_type, code in mapping.items():
-            if self.input_state.get(device_type, {}).get(code, False):
+            if input_state[device_type].get(code):
                 return True
 
         # Action not active
         return False
 
+    def action_bit(self, action):
+        """
+        Return the bit of an action in active_mask, assigning the next free bit on first use.
+
+        Args:
+            action (str): Name of the action.
+
+        Returns:
+            int: Single-bit mask for the action.
+        """
+        bit = self.action_bits.get(action)
+        if bit is None:
+            bit = self.action_bits[action] = 1 << len(self.action_bits)
+        return bit
+
     def clear_local_callbacks(self):
         """
         Remove all local callbacks.
@@ -220,21 +265,12 @@ class InputManager(BaseManager):
         """
         Process components events.
         """
-        # Determine device type and code, set pressed state
-        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
-            device_type = "key"
-            code = event.key
-            state = event.type == pygame.KEYDOWN
-        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
-            device_type = "mouse"
-            code = event.button
-            state = event.type == pygame.MOUSEBUTTONDOWN
-        else:
+        # Resolve device type, event type and pressed state with a single lookup
+        dispatch = self.EVENT_DISPATCH.get(event.type)
+        if dispatch is None:
             return
-
-        # Select event type based on state
-        down_event, up_event = self.DEVICE_TO_EVENT[device_type]
-        event_type = down_event if state else up_event
+        device_type, code_attr, event_type, state = dispatch
+        code = getattr(event, code_attr)
 
         # Execute first found callback
         for scope in self.SCOPES:
@@ -244,4 +280,12 @@ class InputManager(BaseManager):
                 break
 
         # Update input state
-        self.input_state[device_type][code] = state
\ No newline at end of file
+        self.input_state[device_type][code] = state
+
+        # Update held actions (edge-triggered, set on press and cleared on release)
+        bits = self._code_bits.get((device_type, code))
+        if bits:
+            if state:
+                self.active_mask |= bits
+            else:
+                self.active_mask &= ~bits
\ No newline at end of file
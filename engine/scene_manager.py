@@ -15,6 +15,7 @@ class SceneManager(BaseManager):
             scenes (list[BaseScene]): Stack of scenes.
             current_scene (BaseScene): Currently active scene instance.
             previous_scene (BaseScene): Previously active scene instance.
+            _scene_cache (dict[type, BaseScene]): Scene instances reused across transitions, keyed by class.
 
     Methods:
         Configuration:
@@ -22,6 +23,7 @@ class SceneManager(BaseManager):
             load_config(config): Load settings from configuration.
 
         Scene Management:
+            get_scene(BaseScene): Return the cached instance of a scene class.
             set_scene(BaseScene): Set a new scene.
             push_scene(BaseScene): Push a new scene on top of the stack.
             pop_scene(): Pop the current scene off the stack.
@@ -40,6 +42,7 @@ class SceneManager(BaseManager):
         self.scenes = []
         self.previous_scene = None
         self.current_scene = None
+        self._scene_cache = {}
 
         # Initialize BaseManager and components
         super().__init__(core_manager, app_config)
@@ -70,11 +73,24 @@ class SceneManager(BaseManager):
 
     """
     Scene Management
+        get_scene
         set_scene
         push_scene
         pop_scene
         clear_scenes
     """
+    def get_scene(self, scene_class):
+        """
+        Return the cached instance of a scene class, creating it on first use.
+
+        set_scene and push_scene call reset() on the returned scene to start a new visit, so one
+        instance serves every transition.
+        """
+        scene = self._scene_cache.get(scene_class)
+        if scene is None:
+            scene = self._scene_cache[scene_class] = scene_class(self.core_manager)
+        return scene
+
     def set_scene(self, scene_class):
         """
         Set a new scene.
@@ -83,9 +99,10 @@ class SceneManager(BaseManager):
         if self.current_scene:
             self.current_scene.exit()
 
-        # Create and setup new scene
+        # Fetch and setup new scene
         self.previous_scene = self.current_scene
-        self.current_scene = scene_class(self.core_manager)
+        self.current_scene = self.get_scene(scene_class)
+        self.current_scene.reset()
         self.current_scene.enter()
 
         # Reset stack
@@ -95,13 +112,18 @@ class SceneManager(BaseManager):
         """
         Push a new scene onto the stack.
         """
+        # Early return if the scene is already stacked (its single cached instance cannot be pushed twice)
+        if self._scene_cache.get(scene_class) in self.scenes:
+            return
+
         # Call exit on old scene
         if self.current_scene:
             self.current_scene.exit()
 
-        # Create and setup new scene
+        # Fetch and setup new scene
         self.previous_scene = self.current_scene
-        self.current_scene = scene_class(self.core_manager)
+        self.current_scene = self.get_scene(scene_class)
+        self.current_scene.reset()
         self.current_scene.enter()
 
         # Push it on stack
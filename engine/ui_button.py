@@ -16,6 +16,9 @@ class UIButton(UIElement):
         callback (Callable): Function to call when pressed.
         highlighted (bool): Visual highlighted state.
     """
+    # Brightness added to the background when highlighted
+    HIGHLIGHT_OFFSET = 30
+
     def __init__(self, name, text="Button", x=0, y=0, w=120, h=40,
                  font=None, bg_color=(70, 70, 70), text_color=(255, 255, 255),
                  callback: Callable = None, highlighted=False, **kwargs):
@@ -31,6 +34,17 @@ class UIButton(UIElement):
         # Internal state for edge detection of mouse button
         self._mouse_was_down = False
 
+    @property
+    def bg_color(self):
+        """Background color."""
+        return self._bg_color
+
+    @bg_color.setter
+    def bg_color(self, color):
+        # Precompute the highlighted variant once instead of every frame
+        self._bg_color = color
+        self._bg_highlight_color = tuple(min(255, c + self.HIGHLIGHT_OFFSET) for c in color[:3])
+
     def set_highlighted(self, state: bool):
         """Set visual highlighted state."""
         self.highlighted = bool(state)
@@ -40,11 +54,11 @@ class UIButton(UIElement):
             self._mouse_was_down = False
             return
 
-        mx, my = pygame.mouse.get_pos()
         mouse_down = pygame.mouse.get_pressed()[0]
 
         # If mouse is pressed now and wasn't pressed previously and pointer is inside -> trigger
-        if mouse_down and not self._mouse_was_down and self.rect.collidepoint(mx, my):
+        # (the pointer position is only queried on the press edge, not every frame)
+        if mouse_down and not self._mouse_was_down and self.rect.collidepoint(pygame.mouse.get_pos()):
             if self.callback:
                 try:
                     self.callback()
@@ -62,17 +76,14 @@ class UIButton(UIElement):
         if not self.visible:
             return
 
-        # base background
+        # base background (slightly brighter when highlighted)
         self.highlighted = self.focused
-        bg = self.bg_color
-        if self.highlighted:
-            # slightly brighter when highlighted
-            bg = (min(255, bg[0] + 30), min(255, bg[1] + 30), min(255, bg[2] + 30))
+        bg = self._bg_highlight_color if self.highlighted else self._bg_color
 
         pygame.draw.rect(surface, bg, self.rect)
 
         # text
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = self._render_text(self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -14,6 +14,7 @@ class UIElement:
     Methods:
         update(): Update the element.
         render(surface): Render the element to the given surface.
+        _render_text(color): Return the element text rendered with its font, cached between frames.
     """
     def __init__(self, name: str, x=0, y=0, w=100, h=30, visible=True, focusable=None, **kwargs):
         self.name = name
@@ -24,10 +25,22 @@ class UIElement:
         self.disabled = None
         self.focusable = focusable
 
+        # Text surface cache for subclasses that draw text (see _render_text)
+        self._text_surf = None
+        self._text_key = None
+
     def update(self):
         """Update element state."""
         pass
 
+    def _render_text(self, color):
+        """Return self.text rendered with self.font, rasterizing only when text, color or font changed."""
+        key = (self.text, color, self.font)
+        if key != self._text_key:
+            self._text_surf = self.font.render(self.text, True, color)
+            self._text_key = key
+        return self._text_surf
+
     def render(self, surface):
         """Render element base (debug outline)."""
         if self.visible:
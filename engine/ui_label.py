@@ -26,7 +26,7 @@ class UILabel(UIElement):
             return
 
         # Render text and blit according to alignment
-        text_surf = self.font.render(self.text, True, self.color)
+        text_surf = self._render_text(self.color)
         text_rect = text_surf.get_rect()
         if self.align == "center":
             text_rect.center = self.rect.center
@@ -13,6 +13,7 @@ class UIManager(BaseManager):
     Constants:
         DEFAULT_LAYER (str): Default layer name.
         LAYER_ORDER (list[str]): Default order for layers (background -> UI -> overlay).
+        ELEMENT_TYPES (dict[str, type]): Maps element type names to element classes.
 
     Attributes:
         UI Attributes:
@@ -137,14 +138,11 @@ class UIManager(BaseManager):
         # Resolve target layer
         layer = layer or self.DEFAULT_LAYER
 
-        # Resolve element class
+        # Resolve element class from the shared registry (single lookup)
         element_class = self.ELEMENT_TYPES.get(element_type, UIElement)
 
-        # Instantiate element
-        element = element_class(name=name, **kwargs)
-
-        # Register element
-        self.elements[name] = element
+        # Instantiate and register element
+        element = self.elements[name] = element_class(name=name, **kwargs)
 
         # Ensure layer exists and is tracked in order
         if layer not in self.layers:
@@ -1,18 +1,47 @@
 # engine\window_manager.py
 
-import ctypes
 import os
 import sys
+from functools import lru_cache
 import pygame
 from engine.base_manager import BaseManager
 
-SW_MAXIMIZE = 3
-SW_RESTORE = 9
+# Window mode bits packed into WindowManager._state_bits
+BORDERLESS_BIT = 1
+RESIZABLE_BIT = 2
+FULLSCREEN_BIT = 4
+
+# Center the game window (read once by SDL at video init, keep any user override)
+os.environ.setdefault('SDL_VIDEO_CENTERED', '1')
+
+# Keep SDL pumping the Windows message loop so events keep flowing (frame deltas are clamped by CoreManager)
+os.environ.setdefault('SDL_WINDOWS_ENABLE_MESSAGELOOP', '1')
+
+# Bind native window functions once, with explicit signatures (Windows only, other platforms skip importing ctypes)
+_IS_WINDOWS = sys.platform.startswith("win")
+if _IS_WINDOWS:
+    import ctypes
+
+    SW_MAXIMIZE = 3
+    SW_RESTORE = 9
+
+    # Private handle, so the signatures below do not leak into the shared ctypes.windll.user32
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _ShowWindow = _user32.ShowWindow
+    _ShowWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    _ShowWindow.restype = ctypes.c_int
+    _IsZoomed = _user32.IsZoomed
+    _IsZoomed.argtypes = [ctypes.c_void_p]
+    _IsZoomed.restype = ctypes.c_int
 
 class WindowManager(BaseManager):
     """
     Manage window and rendering surface.
 
+    Constants:
+        CAPTION_INTERVAL (float): Minimum delay between FPS caption refreshes (seconds).
+        FLAG_TABLE (list[int]): Display flags indexed by window mode bits (BORDERLESS_BIT | RESIZABLE_BIT | FULLSCREEN_BIT).
+
     Attributes:
         Time Attributes:
             clock (pygame.time.Clock): Optional clock for FPS display.
@@ -28,58 +57,106 @@ class WindowManager(BaseManager):
         Flag Attributes:
             flags (int): Current Pygame display flags.
             maximized (bool): Whether the window is maximized.
-            resizable (bool): Whether the window is resizable.
-            borderless (bool): Whether the window is borderless.
-            fullscreen (bool): Whether fullscreen mode is active.
+            resizable (bool): Whether the window is resizable (bit of _state_bits).
+            borderless (bool): Whether the window is borderless (bit of _state_bits).
+            fullscreen (bool): Whether fullscreen mode is active (bit of _state_bits).
 
         Size Attributes:
             render_size (tuple[int, int]): Logical size for rendering content.
             scaled_size (tuple[int, int]): Scaled size of the content on screen.
             windowed_size (tuple[int, int]): Size of the actual window in windowed mode.
+            smooth_scaling (bool): Whether to filter the scaled content instead of using nearest-neighbour.
 
         Surface Attributes:
             render_surface (pygame.Surface): Surface where all drawing occurs.
             display_surface (pygame.Surface): Surface displayed on the window.
             display_gap (tuple[int, int]): Gap for centering content when scaled.
+            letterbox_rects (list[pygame.Rect]): Display areas left uncovered by the scaled content.
 
     Methods:
         Configuration:
             _setup(): Initialize components.
             load_config(config): Load settings from configuration.
             _apply_surface_sizes(): Apply current render and scaled sizes.
+            _apply_display_surface(): Recreates the display surface at the scaled size.
+            _apply_render_surface(): Recreates the render surface if its size changed.
+            _set_mode(size, flags): Sets the display mode unless the window already has it.
             set_caption(tag, title, version, display_tag, display_version, display_fps): Sets the window caption.
             set_flags(resizable, borderless, fullscreen): Sets the display surface flags.
             set_render_size(width, height): Sets the render surface size.
             set_scaled_size(width, height): Sets the scaled surface size.
+            set_zoom(zoom): Sets the scaled surface size as a multiple of the render size.
 
         Resizing & Scaling:
-            _detect_maximized(): Detects if the window is maximized.
+            _get_desktop_size(): Returns the cached primary desktop size.
+            invalidate_desktop_size(): Clears the cached desktop size.
+            _detect_maximized(window_size, desktop_size): Detects if the window is maximized.
             _calculate_aspect_ratio_fit(reference_size, target_size): Fits target size while preserving aspect ratio.
             _adjust_scaled_size(): Adjusts scaled surface size.
+            _update_scaling(): Refreshes scaling state after a size change.
+            _get_scaled_buffer(): Returns a view of the scratch surface at the scaled size.
             _adjust_windowed_size(): Adjusts windowed surface size.
-            _adjust_maximized(): Adjusts scaled surface and center content for maximized windows.
-            resize(): Handles window resizing event and update surfaces.
+            _compute_letterbox_rects(window_size): Computes the display areas around the scaled content.
+            _adjust_maximized(window_size): Adjusts scaled surface and center content for maximized windows.
+            resize(size): Queues a window resize to be applied on the next update.
+            _apply_resize(): Applies window resizing and update surfaces.
 
         State Management:
             _compute_flags(): Computes pygame display flags from current state.
+            _get_hwnd(): Returns the cached native window handle.
+            _is_zoomed(): Checks if the native window is maximized.
             _restore_window(): Restores the window from maximized state.
             _maximize_window(): Maximizes the window.
+            iconify(): Minimizes the window.
             toggle_maximized(): Toggles between maximized and restored states.
             toggle_borderless(): Toggles borderless window mode.
             toggle_resizable(): Toggles resizable window mode.
             toggle_fullscreen(): Toggles fullscreen window mode.
 
+        Surface Access:
+            pixels3d(): Returns a writable pixel array view of the render surface.
+
         Debug:
             debug(): Print debug information.
 
         Operations:
-            _update_caption(): Updates the window caption.
-            update(dt): Update components.
+            _update_caption(fps): Updates the window caption.
+            _update_caption_throttled(dt): Updates the window caption at most once per CAPTION_INTERVAL.
+            _skip_caption(dt): Caption step used when FPS display is off.
+            update(dt): Update components (refreshes the FPS caption at CAPTION_INTERVAL).
+            invalidate_present(): Forces the next render to present the whole window.
             render(surface): Render components.
     """
+    # Fixed attribute layout for fast access on the render path
+    __slots__ = (
+        # Time Attributes
+        "clock", "_get_fps",
+        # Caption Attributes
+        "tag", "version", "title", "display_tag", "display_version", "display_fps",
+        "_caption", "_caption_template", "_caption_accum", "_last_fps", "_caption_step",
+        # Flag Attributes
+        "flags", "maximized", "_state_bits", "_hwnd",
+        # Size Attributes
+        "render_size", "scaled_size", "windowed_size", "_desktop_size", "_pending_size", "_applied_resize", "_applied_mode",
+        "smooth_scaling",
+        # Surface Attributes
+        "render_surface", "display_surface", "display_gap", "letterbox_rects", "_scaled_scratch", "_scaled_buffer", "_scale_is_identity", "_scale_fn",
+        "_content_rect", "_needs_full_present", "_last_gap",
+    )
+
+    # Constants
+    CAPTION_INTERVAL = 0.5
+    FLAG_TABLE = [
+        (pygame.RESIZABLE if bits & RESIZABLE_BIT and not bits & FULLSCREEN_BIT else 0)
+        | (pygame.NOFRAME if bits & BORDERLESS_BIT else 0)
+        | (pygame.FULLSCREEN if bits & FULLSCREEN_BIT else 0)
+        for bits in range(8)
+    ]
+
     def __init__(self, core_manager=None, app_config=None, clock=None):
         # Time Attributes
         self.clock = clock
+        self._get_fps = clock.get_fps if clock else None
 
         # Caption Attributes
         self.tag = None
@@ -88,23 +165,40 @@ class WindowManager(BaseManager):
         self.display_tag = None
         self.display_version = None
         self.display_fps = None
+        self._caption = None
+        self._caption_template = ""
+        self._caption_accum = 0.0
+        self._last_fps = None
+        self._caption_step = self._skip_caption
 
         # Flag Attributes
         self.flags = None
         self.maximized = None
-        self.resizable = None
-        self.borderless = None
-        self.fullscreen = None
+        self._state_bits = 0
+        self._hwnd = None
 
         # Size Attributes
         self.render_size = None
         self.scaled_size = None
         self.windowed_size = None
+        self._desktop_size = None
+        self._pending_size = None
+        self._applied_resize = None
+        self._applied_mode = None
+        self.smooth_scaling = False
 
         # Surface Attributes
         self.render_surface = None
         self.display_surface = None
         self.display_gap = None
+        self.letterbox_rects = []
+        self._scaled_scratch = None
+        self._scaled_buffer = None
+        self._scale_is_identity = False
+        self._scale_fn = pygame.transform.scale
+        self._content_rect = None
+        self._needs_full_present = True
+        self._last_gap = None
 
         # Initialize BaseManager and components
         super().__init__(core_manager, app_config)
@@ -114,18 +208,19 @@ class WindowManager(BaseManager):
         _setup
         load_config
         _apply_surface_sizes
+        _apply_display_surface
+        _apply_render_surface
+        _set_mode
         set_caption
         set_flags
         set_render_size
         set_scaled_size
+        set_zoom
     """
     def _setup(self):
         """
         Initialize components.
         """
-        # Set environment variable to center the game window
-        os.environ['SDL_VIDEO_CENTERED'] = '1'
-
         # Initialize attributes
         self.flags = 0
 
@@ -142,8 +237,21 @@ class WindowManager(BaseManager):
 
         # Apply configuration values
         self.set_caption(config['tag'], config['title'], config['version'], config['display_tag'], config['display_version'], config['display_fps'])
-        self.set_render_size(config['render_width'], config['render_height'])
-        self.set_scaled_size(config['scaled_width'], config['scaled_height'])
+
+        # Scaling filter is optional, nearest-neighbour keeps pixel art sharp
+        self.smooth_scaling = config.get('smooth_scaling', False)
+
+        # Resizability needs no extra window handling, fold it into the first display mode
+        self.resizable = config['resizable']
+        self.flags = self._compute_flags()
+
+        # Sizes are always present in config, apply both with a single surface setup
+        self.render_size = config['render_width'], config['render_height']
+        self.scaled_size = config['scaled_width'], config['scaled_height']
+        self._apply_surface_sizes()
+        self._update_scaling()
+
+        # Apply window modes (no-ops unless they differ from the applied mode)
         self.toggle_resizable(config['resizable'])
         self.toggle_borderless(config['borderless'])
         self.toggle_fullscreen(config['fullscreen'])
@@ -156,10 +264,57 @@ class WindowManager(BaseManager):
         if not self.render_size or not self.scaled_size:
             return
 
+        # Apply new settings (the display must exist before converting surfaces)
+        self._apply_display_surface()
+        self._apply_render_surface()
+        self._apply_resize()
+
+    def _apply_display_surface(self):
+        """
+        Recreates the display surface at the scaled size.
+        """
+        # Early return if action is not applicable
+        if not self.scaled_size:
+            return
+
+        # Apply new settings
+        self._set_mode(self.scaled_size, self.flags)
+
+    def _apply_render_surface(self):
+        """
+        Recreates the render surface if its size changed.
+        """
+        # Early return if the current surface already has the requested size
+        if not self.render_size or self.render_surface is not None and self.render_surface.get_size() == self.render_size:
+            return
+
+        # Allocate in the display pixel format
+        self.render_surface = pygame.Surface(self.render_size).convert(self.display_surface)
+
+    def _set_mode(self, size, flags):
+        """
+        Sets the display mode unless the window already has it.
+
+        Args:
+            size (tuple[int, int]): Requested window size.
+            flags (int): Pygame display flags.
+        """
+        # Early return if the same mode was applied and the window still has that size
+        if (size, flags) == self._applied_mode and pygame.display.get_window_size() == size:
+            return
+
         # Apply new settings
-        self.render_surface = pygame.Surface(self.render_size)
-        self.display_surface = pygame.display.set_mode(self.scaled_size, self.flags)
-        self.resize()
+        self.display_surface = pygame.display.set_mode(size, flags)
+        self._applied_mode = size, flags
+
+        # The native window may have been recreated, fetch its handle again on next use
+        self._hwnd = None
+
+        # Surface contents are undefined after a mode change, letterbox bars must be cleared again
+        self._last_gap = None
+
+        # Layout changed, present the whole window once
+        self._needs_full_present = True
 
     def set_caption(self, tag=None, title=None, version=None, display_tag=None, display_version=None, display_fps=None):
         """
@@ -191,6 +346,21 @@ class WindowManager(BaseManager):
         if display_fps is not None:
             self.display_fps = display_fps
 
+        # Precompile the caption template, leaving only the FPS to format per update
+        parts = []
+        if self.display_tag and self.tag:
+            parts.append(f"{self.tag}")
+        parts.append(self.title)
+        if self.display_version and self.version:
+            parts.append(f"{self.version}")
+        caption = " ".join(parts)
+        if self.display_fps and self.clock:
+            caption = caption.replace("%", "%%") + " (%d FPS)"
+        self._caption_template = caption
+
+        # Select the per-frame caption step once, instead of checking the flags on every update
+        self._caption_step = self._update_caption_throttled if self.display_fps and self.clock else self._skip_caption
+
         # Apply new settings
         self._update_caption()
 
@@ -210,11 +380,17 @@ class WindowManager(BaseManager):
         width = width or self.render_size[0]
         height = height or self.render_size[1]
 
+        # Early return if the size is unchanged (avoids reallocating surfaces)
+        if (width, height) == self.render_size:
+            return
+
         # Update surface size
         self.render_size = width, height
 
-        # Apply new settings
-        self._apply_surface_sizes()
+        # Apply new settings (the display mode only depends on the scaled size)
+        self._apply_render_surface()
+        self._apply_resize()
+        self._update_scaling()
 
     def set_scaled_size(self, width=None, height=None):
         """
@@ -232,30 +408,74 @@ class WindowManager(BaseManager):
         width = width or self.scaled_size[0]
         height = height or self.scaled_size[1]
 
+        # Early return if the size is unchanged (avoids reallocating surfaces)
+        if (width, height) == self.scaled_size:
+            return
+
         # Update surface size
         self.scaled_size = width, height
 
         # Apply new settings
         self._apply_surface_sizes()
+        self._update_scaling()
+
+    def set_zoom(self, zoom):
+        """
+        Sets the scaled surface size as a multiple of the render size.
+
+        Args:
+            zoom (float): Scale factor applied to the render size.
+        """
+        self.set_scaled_size(int(self.render_size[0] * zoom), int(self.render_size[1] * zoom))
 
     """
     Resizing & Scaling
+        _get_desktop_size
+        invalidate_desktop_size
         _detect_maximized
         _calculate_aspect_ratio_fit
         _adjust_scaled_size
+        _update_scaling
+        _get_scaled_buffer
         _adjust_windowed_size
+        _compute_letterbox_rects
         _adjust_maximized
         resize
+        _apply_resize
     """
-    def _detect_maximized(self):
+    def _get_desktop_size(self):
         """
-        Detects if the window is maximized.
+        Returns the cached primary desktop size.
+
+        Returns:
+            tuple[int, int]: Primary monitor resolution.
+        """
+        # Query SDL only once, the desktop resolution rarely changes
+        if self._desktop_size is None:
+            self._desktop_size = pygame.display.get_desktop_sizes()[0]
+        return self._desktop_size
+
+    def invalidate_desktop_size(self):
+        """
+        Clears the cached desktop size.
         """
-        # Get the primary monitor size (desktop resolution)
-        desktop_width, desktop_height = pygame.display.get_desktop_sizes()[0]
+        self._desktop_size = None
 
-        # Get current window size
-        window_width, window_height = pygame.display.get_window_size()
+        # The scratch surface is sized after the desktop, reallocate it on next use
+        self._scaled_scratch = None
+        self._scaled_buffer = None
+
+    def _detect_maximized(self, window_size, desktop_size):
+        """
+        Detects if the window is maximized.
+
+        Args:
+            window_size (tuple[int, int]): Current window size.
+            desktop_size (tuple[int, int]): Primary monitor size (desktop resolution).
+        """
+        # Unpack window and desktop sizes
+        window_width, window_height = window_size
+        desktop_width, desktop_height = desktop_size
 
         # Determine if the window is maximized
         height_threshold = 0.90 * desktop_height
@@ -264,27 +484,29 @@ class WindowManager(BaseManager):
         self.maximized = window_width == desktop_width and window_height >= height_threshold
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _calculate_aspect_ratio_fit(reference_size, target_size):
         """
         Fits target size while preserving aspect ratio.
+
+        Results are memoized, as resize events tend to repeat the same sizes.
         """
         # Unpack the reference and target sizes
         ref_w, ref_h = reference_size
         tgt_w, tgt_h = target_size
 
-        # Calculate relative change per dimension
-        delta_w = abs(1 - tgt_w / ref_w)
-        delta_h = abs(1 - tgt_h / ref_h)
+        # Early return for identity fits (common at startup and in plain windowed mode)
+        if ref_w == tgt_w and ref_h == tgt_h:
+            return tgt_w, tgt_h
 
-        # Choose the scaling factor based on the more restrictive dimension
-        if delta_w < delta_h:
+        # Compare relative change per dimension, cross-multiplied to stay in integers
+        # (|1 - tgt_w / ref_w| < |1 - tgt_h / ref_h|)
+        if abs(ref_w - tgt_w) * ref_h < abs(ref_h - tgt_h) * ref_w:
             # Scale height to match width
-            scale_factor = tgt_w / ref_w
-            return tgt_w, int(ref_h * scale_factor)
+            return tgt_w, ref_h * tgt_w // ref_w
         else:
             # Scale width to match height
-            scale_factor = tgt_h / ref_h
-            return int(ref_w * scale_factor), tgt_h
+            return ref_w * tgt_h // ref_h, tgt_h
 
     def _adjust_scaled_size(self):
         """
@@ -296,6 +518,49 @@ class WindowManager(BaseManager):
 
         # Adjust scaled surface while preserving the render surface aspect ratio
         self.scaled_size = self._calculate_aspect_ratio_fit(render_size, display_size)
+        self._update_scaling()
+
+    def _update_scaling(self):
+        """
+        Refreshes scaling state after a size change.
+
+        The scaled buffer view is recreated on the next render that needs scaling.
+        """
+        # Cache whether content is presented at native size
+        self._scale_is_identity = self.scaled_size == self.render_size
+
+        # Pick the scaler once per change instead of on every frame (smoothscale needs 24/32-bit surfaces)
+        if self.smooth_scaling and self.render_surface is not None and self.render_surface.get_bitsize() in (24, 32):
+            self._scale_fn = pygame.transform.smoothscale
+        else:
+            self._scale_fn = pygame.transform.scale
+
+        # Drop the buffer view only if its size is stale
+        if self._scaled_buffer is not None and self._scaled_buffer.get_size() != self.scaled_size:
+            self._scaled_buffer = None
+
+    def _get_scaled_buffer(self):
+        """
+        Returns a view of the scratch surface at the scaled size.
+
+        The scratch surface is allocated once at desktop size, so resizing
+        only creates a new subsurface view instead of a new pixel buffer.
+
+        Returns:
+            pygame.Surface: Subsurface of the scratch surface sized to scaled_size.
+        """
+        scaled_w, scaled_h = self.scaled_size
+
+        # Allocate the scratch surface in the display pixel format, large enough for the desktop and the content
+        scratch = self._scaled_scratch
+        if scratch is None or scratch.get_width() < scaled_w or scratch.get_height() < scaled_h:
+            desktop_w, desktop_h = self._get_desktop_size()
+            scratch_size = max(desktop_w, scaled_w), max(desktop_h, scaled_h)
+            scratch = self._scaled_scratch = pygame.Surface(scratch_size).convert(self.display_surface)
+
+        # Cache the view until the scaled size changes
+        self._scaled_buffer = scratch.subsurface((0, 0, scaled_w, scaled_h))
+        return self._scaled_buffer
 
     def _adjust_windowed_size(self):
         """
@@ -306,12 +571,43 @@ class WindowManager(BaseManager):
         window_height = self.scaled_size[1] + self.display_gap[1] * 2
         self.windowed_size = window_width, window_height
 
-    def _adjust_maximized(self):
+    def _compute_letterbox_rects(self, window_size):
+        """
+        Computes the display areas around the scaled content.
+
+        Args:
+            window_size (tuple[int, int]): Current window size.
+
+        Returns:
+            list[pygame.Rect]: Non-empty bars left uncovered by the scaled content.
+        """
+        # Unpack window, content and gap sizes
+        window_width, window_height = window_size
+        scaled_width, scaled_height = self.scaled_size
+        gap_x, gap_y = self.display_gap
+
+        # Left/right bars span the full height, top/bottom bars span the content width
+        right_x = gap_x + scaled_width
+        bottom_y = gap_y + scaled_height
+        rects = [
+            pygame.Rect(0, 0, gap_x, window_height),
+            pygame.Rect(right_x, 0, window_width - right_x, window_height),
+            pygame.Rect(gap_x, 0, scaled_width, gap_y),
+            pygame.Rect(gap_x, bottom_y, scaled_width, window_height - bottom_y),
+        ]
+
+        # Keep only bars with an actual area
+        return [rect for rect in rects if rect.width > 0 and rect.height > 0]
+
+    def _adjust_maximized(self, window_size):
         """
         Adjusts scaled surface and center content for maximized windows.
+
+        Args:
+            window_size (tuple[int, int]): Current window size.
         """
-        # Get current window size
-        window_width, window_height = pygame.display.get_window_size()
+        # Unpack current window size
+        window_width, window_height = window_size
 
         # Adjust scaled surface to fit the window while preserving aspect ratio
         self._adjust_scaled_size()
@@ -321,24 +617,52 @@ class WindowManager(BaseManager):
         gap_y = (window_height - self.scaled_size[1]) // 2
         self.display_gap = gap_x, gap_y
 
-        # Clear display surface
-        self.display_surface.fill((0, 0, 0))
+        # Clear the letterbox bars only, the content area is redrawn every frame
+        self.letterbox_rects = self._compute_letterbox_rects(window_size)
+
+        # Skip clearing if the bars only shrank within the same window (the content covers the old ones)
+        last_gap = self._last_gap
+        self._last_gap = window_size, self.display_gap
+        if last_gap is not None and last_gap[0] == window_size and gap_x <= last_gap[1][0] and gap_y <= last_gap[1][1]:
+            return
+
+        for rect in self.letterbox_rects:
+            self.display_surface.fill((0, 0, 0), rect)
 
-    def resize(self):
+    def resize(self, size=None):
         """
-        Handles window resizing event and update surfaces.
+        Queues a window resize to be applied on the next update.
+
+        Resize events arrive in bursts while the window is dragged, only the
+        latest one is applied once per frame.
+
+        Args:
+            size (tuple[int, int], optional): New window size reported by the event.
+        """
+        self._pending_size = size or pygame.display.get_window_size()
+
+    def _apply_resize(self):
+        """
+        Applies window resizing and update surfaces.
         """
+        # Query window size once for the whole resize pass
+        window_size = pygame.display.get_window_size()
+
         # Detect if the window is currently maximized
-        self._detect_maximized()
+        self._detect_maximized(window_size, self._get_desktop_size())
 
         if self.maximized or self.borderless:
             # Adjust scaled surface and center content
-            self._adjust_maximized()
+            self._adjust_maximized(window_size)
 
         elif not self.fullscreen:
             # Reset centering gaps for windowed mode
             self.display_gap = (0, 0)
 
+            # Forget the last filled bars, the next maximize gets a fresh framebuffer even when
+            # _set_mode below is skipped
+            self._last_gap = None
+
             # Adjust scaled surface to fit the window while preserving aspect ratio
             self._adjust_scaled_size()
 
@@ -346,18 +670,71 @@ class WindowManager(BaseManager):
             self._adjust_windowed_size()
 
             # Apply updated windowed size to the display surface
-            self.display_surface = pygame.display.set_mode(self.windowed_size, self.flags)
+            self._set_mode(self.windowed_size, self.flags)
+
+        # Remember the handled state to skip echoed resize events
+        self._applied_resize = pygame.display.get_window_size(), self.flags
+
+        # Layout changed, present the whole window once
+        self._needs_full_present = True
 
     """
     State Management
+        resizable
+        borderless
+        fullscreen
+        _set_state_bit
         _compute_flags
+        _get_hwnd
+        _is_zoomed
         _restore_window
         _maximize_window
+        iconify
         toggle_maximized
         toggle_borderless
         toggle_resizable
         toggle_fullscreen
     """
+    @property
+    def resizable(self):
+        """Whether the window is resizable."""
+        return bool(self._state_bits & RESIZABLE_BIT)
+
+    @resizable.setter
+    def resizable(self, state):
+        self._set_state_bit(RESIZABLE_BIT, state)
+
+    @property
+    def borderless(self):
+        """Whether the window is borderless."""
+        return bool(self._state_bits & BORDERLESS_BIT)
+
+    @borderless.setter
+    def borderless(self, state):
+        self._set_state_bit(BORDERLESS_BIT, state)
+
+    @property
+    def fullscreen(self):
+        """Whether fullscreen mode is active."""
+        return bool(self._state_bits & FULLSCREEN_BIT)
+
+    @fullscreen.setter
+    def fullscreen(self, state):
+        self._set_state_bit(FULLSCREEN_BIT, state)
+
+    def _set_state_bit(self, bit, state):
+        """
+        Sets or clears a window mode bit.
+
+        Args:
+            bit (int): Mode bit (BORDERLESS_BIT, RESIZABLE_BIT or FULLSCREEN_BIT).
+            state (bool): True to set the bit, False to clear it.
+        """
+        if state:
+            self._state_bits |= bit
+        else:
+            self._state_bits &= ~bit
+
     def _compute_flags(self):
         """
         Computes pygame display flags from current state.
@@ -365,34 +742,61 @@ class WindowManager(BaseManager):
         Returns:
             flags (int): Bitmask of Pygame display flags
         """
-        # Start with no flags set
-        flags = 0
+        # Look up precomputed flags for the current window mode bits
+        return self.FLAG_TABLE[self._state_bits]
 
-        # Add flags according to window state
-        if self.borderless:
-            flags |= pygame.NOFRAME
-        if self.resizable and not self.fullscreen:
-            flags |= pygame.RESIZABLE
-        if self.fullscreen:
-            flags |= pygame.FULLSCREEN
+    def _get_hwnd(self):
+        """
+        Returns the cached native window handle.
+
+        Returns:
+            int: Native window handle (HWND).
+        """
+        if self._hwnd is None:
+            self._hwnd = pygame.display.get_wm_info()['window']
+        return self._hwnd
+
+    def _is_zoomed(self):
+        """
+        Checks if the native window is maximized.
+
+        Returns:
+            bool: True if the window is maximized, False otherwise or if unsupported.
+        """
+        # Early return if action is not applicable
+        if not _IS_WINDOWS:
+            return False
 
-        return flags
+        return bool(_IsZoomed(self._get_hwnd()))
 
     def _restore_window(self):
         """
         Restores the window from maximized state.
         """
+        # Early return if action is not applicable
+        if not _IS_WINDOWS:
+            return
+
         self.maximized = False
-        hwnd = pygame.display.get_wm_info()['window']
-        ctypes.windll.user32.ShowWindow(hwnd, SW_RESTORE)
+        _ShowWindow(self._get_hwnd(), SW_RESTORE)
 
     def _maximize_window(self):
         """
         Maximizes the window to fill the screen.
         """
+        # Early return if action is not applicable
+        if not _IS_WINDOWS:
+            return
+
         self.maximized = True
-        hwnd = pygame.display.get_wm_info()['window']
-        ctypes.windll.user32.ShowWindow(hwnd, SW_MAXIMIZE)
+        _ShowWindow(self._get_hwnd(), SW_MAXIMIZE)
+
+    def iconify(self):
+        """
+        Minimizes the window.
+        """
+        # Rendering is skipped while minimized, the window is fully presented again when exposed
+        pygame.display.iconify()
 
     def toggle_maximized(self):
         """
@@ -403,19 +807,12 @@ class WindowManager(BaseManager):
             return
 
         # Toggle maximize/restore state
-        if sys.platform.startswith("win"):
-            # Get native window handle
-            hwnd = pygame.display.get_wm_info()['window']
-
-            # Check if the window is currently maximized
-            is_maximized = ctypes.windll.user32.IsZoomed(hwnd)
-
-            if is_maximized:
-                # Restore the window
-                self._restore_window()
-            else:
-                # Maximize the window
-                self._maximize_window()
+        if self._is_zoomed():
+            # Restore the window
+            self._restore_window()
+        else:
+            # Maximize the window
+            self._maximize_window()
 
     def toggle_borderless(self, state=None):
         """
@@ -429,16 +826,17 @@ class WindowManager(BaseManager):
             return
 
         # Restore to apply new flags correctly
-        hwnd = pygame.display.get_wm_info()['window']
-        is_maximized = ctypes.windll.user32.IsZoomed(hwnd)
-        if is_maximized:
+        if self._is_zoomed():
             self._restore_window()
 
-        # Update Pygame display flags
-        self.borderless = not self.borderless if state is None else state
-        self.fullscreen = False
+        # Update Pygame display flags (flip the bit when toggling)
+        if state is None:
+            self._state_bits ^= BORDERLESS_BIT
+        else:
+            self.borderless = state
+        self._state_bits &= ~FULLSCREEN_BIT
         self.flags = self._compute_flags()
-        self.display_surface = pygame.display.set_mode(self.windowed_size, self.flags)
+        self._set_mode(self.windowed_size, self.flags)
 
         # Maximize to apply borderless fullscreen
         if self.borderless:
@@ -455,10 +853,13 @@ class WindowManager(BaseManager):
         if state is not None and state == self.resizable or self.maximized or self.fullscreen:
             return
 
-        # Update Pygame display flags
-        self.resizable = not self.resizable if state is None else state
+        # Update Pygame display flags (flip the bit when toggling)
+        if state is None:
+            self._state_bits ^= RESIZABLE_BIT
+        else:
+            self.resizable = state
         self.flags = self._compute_flags()
-        self.display_surface = pygame.display.set_mode(self.windowed_size, self.flags)
+        self._set_mode(self.windowed_size, self.flags)
 
     def toggle_fullscreen(self, state=None):
         """
@@ -471,28 +872,48 @@ class WindowManager(BaseManager):
         if state is not None and state == self.fullscreen:
             return
 
-        # Update Pygame display flags
-        self.fullscreen = not self.fullscreen if state is None else state
-        self.borderless = False
+        # Update Pygame display flags (flip the bit when toggling)
+        if state is None:
+            self._state_bits ^= FULLSCREEN_BIT
+        else:
+            self.fullscreen = state
+        self._state_bits &= ~BORDERLESS_BIT
         self.flags = self._compute_flags()
 
         if self.fullscreen:
             # Get sizes for fullscreen scaling
             render_size = self.render_surface.get_size()
-            display_size = pygame.display.get_desktop_sizes()[0]
+            display_size = self._get_desktop_size()
 
             # Compute target size preserving aspect ratio
             target_size = self._calculate_aspect_ratio_fit(render_size, display_size)
 
             # Apply fullscreen display mode
-            self.display_surface = pygame.display.set_mode(target_size, self.flags)
+            self._set_mode(target_size, self.flags)
 
             # Reset display gap and adjust content scaling
             self.display_gap = (0, 0)
             self._adjust_scaled_size()
         else:
             # Restore windowed display mode
-            self.display_surface = pygame.display.set_mode(self.windowed_size, self.flags)
+            self._set_mode(self.windowed_size, self.flags)
+
+    """
+    Surface Access
+        pixels3d
+    """
+    def pixels3d(self):
+        """
+        Returns a writable pixel array view of the render surface.
+
+        The array shares memory with the surface, so per-pixel effects can be
+        applied with vectorized NumPy operations instead of Python loops.
+        The surface stays locked while the array is alive. Requires NumPy.
+
+        Returns:
+            numpy.ndarray: Array of shape (width, height, 3) referencing the render surface pixels.
+        """
+        return pygame.surfarray.pixels3d(self.render_surface)
 
     """
     Debug
@@ -509,51 +930,108 @@ class WindowManager(BaseManager):
         print(f"display_surface_size={self.display_surface.get_size()}")
         print(pygame.display.get_surface().get_size())
         print(pygame.display.get_window_size())
-        print(pygame.display.Info().current_w, pygame.display.Info().current_h)
+        display_info = pygame.display.Info()
+        print(display_info.current_w, display_info.current_h)
         print(pygame.display.get_desktop_sizes())
         print()
 
     """
     Operations
         _update_caption
+        _update_caption_throttled
+        _skip_caption
         update
+        invalidate_present
         render
     """
-    def _update_caption(self):
+    def _update_caption(self, fps=None):
         """
         Updates the window caption.
-        """
-        parts = []
 
-        # Optional tag display
-        if self.display_tag and self.tag:
-            parts.append(f"{self.tag}")
+        Args:
+            fps (int, optional): FPS value already read by the caller, queried from the clock if omitted.
+        """
+        # Fill the FPS into the template built by set_caption
+        caption = self._caption_template
+        if self.display_fps and self.clock:
+            self._last_fps = int(self._get_fps()) if fps is None else fps
+            caption = caption % self._last_fps
 
-        # Window title
-        parts.append(self.title)
+        # Skip the window manager round-trip if nothing changed
+        if caption == self._caption:
+            return
 
-        # Optional version display
-        if self.display_version and self.version:
-            parts.append(f"{self.version}")
+        # Update new caption
+        self._caption = caption
+        pygame.display.set_caption(caption)
 
-        # Optional FPS display
-        if self.display_fps and self.clock:
-            parts.append(f"({int(self.clock.get_fps())} FPS)")
+    def _update_caption_throttled(self, dt):
+        """
+        Updates the window caption at most once per CAPTION_INTERVAL.
 
-        # Update new caption
-        pygame.display.set_caption(" ".join(parts))
+        Args:
+            dt (float): Time elapsed since the previous frame (seconds), None refreshes right away.
+        """
+        # Refresh FPS caption at a human-readable rate, using the frame delta already at hand
+        # (without a delta there is nothing to accumulate, so fall back to refreshing every update)
+        if dt is not None:
+            self._caption_accum += dt
+            if self._caption_accum < self.CAPTION_INTERVAL:
+                return
+        self._caption_accum = 0.0
+
+        # Skip formatting entirely while the displayed FPS value is unchanged
+        fps = int(self._get_fps())
+        if fps != self._last_fps:
+            self._update_caption(fps)
+
+    def _skip_caption(self, dt):
+        """
+        Caption step used when FPS display is off.
+        """
+        pass
 
     def update(self, dt=None):
         """
         Update components.
         """
-        if self.display_fps and self.clock:
-            self._update_caption()
+        # Apply the latest queued resize, unless it matches the handled state
+        if self._pending_size is not None:
+            if (self._pending_size, self.flags) != self._applied_resize:
+                self._apply_resize()
+            self._pending_size = None
+
+        # Refresh FPS caption (step selected by set_caption)
+        self._caption_step(dt)
+
+    def invalidate_present(self):
+        """
+        Forces the next render to present the whole window.
+        """
+        self._needs_full_present = True
 
     def render(self, surface=None):
         """
         Render components.
         """
-        scaled_surface = pygame.transform.scale(self.render_surface, self.scaled_size)
-        self.display_surface.blit(scaled_surface, self.display_gap)
-        pygame.display.flip()
+        if self._scale_is_identity:
+            # Blit directly when no scaling is needed
+            self.display_surface.blit(self.render_surface, self.display_gap)
+        else:
+            # Fetch the buffer view, only recreated after a size change
+            scaled_buffer = self._scaled_buffer
+            if scaled_buffer is None:
+                scaled_buffer = self._get_scaled_buffer()
+
+            # Scale into the persistent buffer instead of allocating a new surface
+            self._scale_fn(self.render_surface, self.scaled_size, scaled_buffer)
+            self.display_surface.blit(scaled_buffer, self.display_gap)
+
+        if self._needs_full_present:
+            # Present the whole window once after a layout change (letterbox bars included)
+            self._content_rect = pygame.Rect(self.display_gap, self.scaled_size)
+            self._needs_full_present = False
+            pygame.display.flip()
+        else:
+            # Only the content area changes between frames
+            pygame.display.update(self._content_rect)
@@ -2,37 +2,64 @@
 
 import sys
 import importlib
-import traceback
+import importlib.util
+import logging
 
 from data.shared.constants import DATA_FOLDER, DEFAULT_STARTUP_APP_NAME, DEFAULT_APP_FILE_NAME
 
+log = logging.getLogger(__name__)
 
-def load_main_module(name):
+# Imported main modules by app name (repeated runs skip the importer search)
+_module_cache = {}
+
+
+def load_main_module(name, module_path):
     """Import the main module from a given app folder."""
-    module_path = f"{DATA_FOLDER}.{name}.{DEFAULT_APP_FILE_NAME}"
+    module = _module_cache.get(name)
+    if module is not None:
+        return module
+
+    # Report a missing app without a traceback (find_spec raises when a parent package of a
+    # dotted name is missing or the name is malformed, and it runs the app package __init__)
+    package_path = module_path.rpartition(".")[0]
     try:
-        return importlib.import_module(module_path)
+        found = importlib.util.find_spec(package_path) is not None and importlib.util.find_spec(module_path) is not None
+    except (ImportError, ValueError):
+        found = False
     except Exception:
-        print(f"[ERROR] Exception occurred while importing '{module_path}':"
-              f"\n{traceback.format_exc()}")
+        log.exception("Exception occurred while importing '%s':", module_path)
+        return None
+    if not found:
+        log.error("Module '%s' not found.", module_path)
+        return None
+
+    try:
+        module = _module_cache[name] = importlib.import_module(module_path)
+        return module
+    except Exception:
+        log.exception("Exception occurred while importing '%s':", module_path)
     return None
 
-def run_main_module(module, name):
+def run_main_module(module, module_path):
     """Run the 'main()' function from the imported module."""
     try:
         module.main()
         return True
     except Exception:
-        print(f"[ERROR] Exception occurred while running '{DATA_FOLDER}.{name}.{DEFAULT_APP_FILE_NAME}.main()':"
-              f"\n{traceback.format_exc()}")
+        log.exception("Exception occurred while running '%s.main()':", module_path)
     return False
 
 def run(name):
     """Load and run the module."""
-    module = load_main_module(name)
-    run_main_module(module, name)
+    # Resolve the dotted module path once for both import and error reporting
+    module_path = f"{DATA_FOLDER}.{name}.{DEFAULT_APP_FILE_NAME}"
+    module = load_main_module(name, module_path)
+    if module is None:
+        return
+    run_main_module(module, module_path)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format="[%(levelname)s] %(message)s")
     target_name = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_STARTUP_APP_NAME
     run(target_name)